@@ -22,36 +22,62 @@ Requirements:
 """
 # Imports
 import os
+import re
+import sys
 from datetime import datetime
 from collections import defaultdict, Counter
+from math import fsum
+from operator import itemgetter
 
 
 # --- Normalization & validation helpers for reporting ---
+_ISO_DATE = re.compile(r"\d{4}-\d{2}-\d{2}")
+# lowercased spelling -> canonical category name, shared by reports and the add prompt
+_CAT_CANONICAL = {"food": "Food"}
+
+
+def _normalize_date(d: str) -> str:
+    """Return `d` as YYYY-MM-DD, raising ValueError if it isn't a real date.
+
+    Canonical input is checked with the C-level fromisoformat; anything
+    else (e.g. 2024-1-5) falls back to strptime, which also pads it.
+    """
+    if _ISO_DATE.fullmatch(d):
+        datetime.fromisoformat(d)
+        return d
+    return datetime.strptime(d, "%Y-%m-%d").strftime("%Y-%m-%d")
+
+
 def _normalize_transaction(t: dict) -> dict | None:
     """Return a cleaned transaction dict or None if unusable for reports."""
-    # normalize/validate type
-    typ = str(t.get("type", "")).strip().lower()
-    if typ not in {"income", "expense"}:
-        return None
-
-    # normalize/validate amount
-    try:
-        amt = float(str(t.get("amount", "")).strip())
-    except (TypeError, ValueError):
-        return None
+    # normalize/validate type; Core already hands out lowercase literals, so
+    # only fall back to strip/lower for raw input
+    typ = t.get("type", "")
+    if typ != "income" and typ != "expense":
+        typ = str(typ).strip().lower()
+        if typ not in {"income", "expense"}:
+            return None
+
+    # normalize/validate amount; stored amounts are already floats, so only
+    # raw input pays for the str/strip/parse round-trip
+    amt = t.get("amount", "")
+    if type(amt) is not float:
+        try:
+            amt = float(str(amt).strip())
+        except (TypeError, ValueError):
+            return None
 
     # normalize/validate date (expect YYYY-MM-DD)
     d = str(t.get("date", "")).strip()
     try:
-        d = datetime.strptime(d, "%Y-%m-%d").strftime("%Y-%m-%d")
+        d = _normalize_date(d)
     except Exception:
         return None
 
     # tidy fields
     desc = (t.get("description") or "").strip()
     cat = (t.get("category") or "").strip()
-    if cat.lower() == "food":
-        cat = "Food"
+    cat = _CAT_CANONICAL.get(cat.lower(), cat)
 
     return {"date": d, "description": desc, "category": cat, "amount": amt, "type": typ}
 
@@ -70,6 +96,50 @@ def _valid_transactions(transactions: list[dict]) -> tuple[list[dict], int]:
 
 # --- Calculation Functions ---
 # Functions to compute totals for income, expenses, and net savings from a list of transactions.
+_amount_and_type = itemgetter("amount", "type")
+
+
+def _summarize(txns, raw=False):
+    """Sum income and expense amounts in one pass.
+
+    Args:
+        txns: A list of transactions returned by `_valid_transactions`, or
+            unvalidated transactions when `raw` is set.
+        raw: Validate each row inline and leave out unusable ones, instead of
+            building a cleaned copy of the list first.
+
+    Returns:
+        A tuple (income, expense, net).
+    """
+    if raw:
+        txns = filter(None, map(_normalize_transaction, txns))
+    # collect per type, then fsum so cents don't drift over long histories
+    inc, exp = [], []
+    for amt, typ in map(_amount_and_type, txns):
+        if typ == "income":
+            inc.append(amt)
+        elif typ == "expense":
+            exp.append(amt)
+    inc, exp = fsum(inc), fsum(exp)
+    return inc, exp, inc - exp
+
+
+def summarize(transactions):
+    """Compute total income, total expenses, and net savings together.
+
+    Validates and sums in the same pass without building a cleaned copy of
+    the list, so callers that need more than one total should prefer this
+    over the individual helpers.
+
+    Args:
+        transactions: A list of transactions.
+
+    Returns:
+        A tuple (income, expense, net).
+    """
+    return _summarize(transactions, raw=True)
+
+
 def total_income(transactions):
     """Compute the total of all income transactions.
 
@@ -79,8 +149,7 @@ def total_income(transactions):
     Returns:
         The sum of amounts for transactions where `type == "income"`.
     """
-    txns, _ = _valid_transactions(transactions)
-    return sum(t["amount"] for t in txns if t["type"] == "income")
+    return summarize(transactions)[0]
 
 
 def total_expenses(transactions):
@@ -92,8 +161,7 @@ def total_expenses(transactions):
     Returns:
         The sum of amounts for transactions where `type == "expense"`.
     """
-    txns, _ = _valid_transactions(transactions)
-    return sum(t["amount"] for t in txns if t["type"] == "expense")
+    return summarize(transactions)[1]
 
 
 def net_savings(transactions):
@@ -105,10 +173,7 @@ def net_savings(transactions):
     Returns:
         Net savings value (total income - total expenses).
     """
-    txns, _ = _valid_transactions(transactions)
-    inc = sum(t["amount"] for t in txns if t["type"] == "income")
-    exp = sum(t["amount"] for t in txns if t["type"] == "expense")
-    return inc - exp
+    return summarize(transactions)[2]
 
 
 def net_value(transactions):
@@ -142,68 +207,91 @@ def list_transactions_print(transactions):
     if not transactions:
         print("(no transactions found)")
         return
-    print("\n# | date       | description                | category       | amount   | type")
-    print("--+------------+----------------------------+----------------+----------+----------")
-    for i, t in enumerate(transactions):
-        print(
-            f"{i:2d}| {t['date']:<10} | {t['description'][:26]:<26} | {t['category'][:14]:<14} | {t['amount']:<8} | {t['type']}")
-
-
-def remove_transaction_by_index(index):
+    # build the whole table first and emit it with a single write
+    lines = [
+        "\n# | date       | description                | category       | amount   | type",
+        "--+------------+----------------------------+----------------+----------+----------",
+    ]
+    lines.extend(
+        f"{i:2d}| {t['date']:<10} | {t['description'][:26]:<26} | {t['category'][:14]:<14} | {t['amount']:<8} | {t['type']}"
+        for i, t in enumerate(transactions))
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def remove_transaction_by_index(index, txns=None):
     """Remove a transaction by its index in the list.
     Args:
         index: The index of the transaction to remove.
+        txns: The list the index refers to, if the caller already loaded it.
+            Loaded fresh when omitted. The list itself is not modified.
     Returns:
         A tuple (success, info) where success is True if removal succeeded,
         and info is either the removed transaction (if success) or the total
         number of transactions (if failure).
     """
-    txns = load_transactions()
+    if txns is None:
+        txns = load_transactions()
     if index < 0 or index >= len(txns):
         return False, len(txns)
-    removed = txns.pop(index)
-    save_transactions(txns)
+    removed = txns[index]
+    save_transactions(txns[:index] + txns[index + 1:])
     return True, removed
 
 
 # --- Reports Menu and Reporting Functions ---
 # Functions to display a reports menu and generate summary reports.
 
+_REPORTS_HEADER = (
+    "\n=== Reports ===\n"
+    "1) Total income vs. total expenses\n"
+    "2) Total expenses by category\n"
+    "3) Monthly breakdown (income, expenses, net)\n"
+    "4) Back\n"
+)
+
+
 def show_reports_menu():
     """Display the reports menu and handle user choices."""
+    raw, txns, skipped = None, None, 0
     while True:
-        print("\n=== Reports ===")
-        print("1) Total income vs. total expenses")
-        print("2) Total expenses by category")
-        print("3) Monthly breakdown (income, expenses, net)")
-        print("4) Back")
+        # static header, built once and written in one call
+        sys.stdout.write(_REPORTS_HEADER)
         choice = input("Choose: ").strip()
 
+        if choice in ("1", "2", "3"):
+            # reports share one validated snapshot for the menu session; it is
+            # rebuilt only when load_transactions hands back a different list
+            latest = load_transactions()
+            if latest is not raw:
+                raw = latest
+                txns, skipped = _valid_transactions(raw)
+
         if choice == "1":
-            report_income_vs_expenses()
+            report_income_vs_expenses(txns, skipped)
         elif choice == "2":
-            report_expenses_by_category()
+            report_expenses_by_category(txns, skipped)
         elif choice == "3":
-            report_monthly_breakdown()
+            report_monthly_breakdown(txns, skipped)
         elif choice == "4":
             break
         else:
             print("Invalid choice. Try again.")
 
 
-def report_income_vs_expenses():
+def report_income_vs_expenses(txns=None, skipped=0):
     """Print totals of income, expenses, and net savings.
 
-    Loads transactions fresh to reflect any changes before the report.
+    Args:
+        txns: Already-validated transactions from `_valid_transactions`.
+            Loaded fresh to reflect any changes when omitted.
+        skipped: Number of invalid transactions dropped from `txns`.
 
     Side Effects:
         Prints a formatted report to stdout.
     """
-    txns_raw = load_transactions()
-    txns, skipped = _valid_transactions(txns_raw)
-    inc = sum(t["amount"] for t in txns if t["type"] == "income")
-    exp = sum(t["amount"] for t in txns if t["type"] == "expense")
-    net = inc - exp
+    if txns is None:
+        txns, skipped = _valid_transactions(load_transactions())
+    inc, exp, net = _summarize(txns)
 
     print("\n--- Total Income vs. Total Expenses ---")
     print(f"Total Income : ${inc:,.2f}")
@@ -219,18 +307,23 @@ def report_income_vs_expenses():
         print("No transactions yet.")
 
 
-def report_expenses_by_category():
+def report_expenses_by_category(txns=None, skipped=0):
     """Print total expenses grouped by category, sorted descending.
 
     Rules:
         - Non-expense transactions are ignored.
         - Blank/missing categories are labeled 'Uncategorized'.
 
+    Args:
+        txns: Already-validated transactions from `_valid_transactions`.
+            Loaded fresh when omitted.
+        skipped: Number of invalid transactions dropped from `txns`.
+
     Side Effects:
         Prints a formatted report to stdout.
     """
-    txns_raw = load_transactions()
-    txns, skipped = _valid_transactions(txns_raw)
+    if txns is None:
+        txns, skipped = _valid_transactions(load_transactions())
     by_cat = defaultdict(float)
     for t in txns:
         if t["type"] == "expense":
@@ -244,33 +337,53 @@ def report_expenses_by_category():
             print(f"(Note: skipped {skipped} invalid transaction(s))")
         return
 
-    rows = sorted(by_cat.items(), key=lambda kv: kv[1], reverse=True)
-    cat_width = max(12, min(28, max(len(k) for k, _ in rows)))
-    print(f"{'Category'.ljust(cat_width)}  Total")
-    print(f"{'-'*cat_width}  {'-'*12}")
-    for cat, total in rows:
-        print(f"{cat.ljust(cat_width)}  ${total:,.2f}")
+    rows = sorted(by_cat.items(), key=itemgetter(1), reverse=True)
+    cat_width = max(12, min(28, max(map(len, by_cat))))
+    lines = [f"{'Category'.ljust(cat_width)}  Total", f"{'-'*cat_width}  {'-'*12}"]
+    lines.extend(f"{cat.ljust(cat_width)}  ${total:,.2f}" for cat, total in rows)
+    sys.stdout.write("\n".join(lines) + "\n")
     if skipped:
         print(f"(Note: skipped {skipped} invalid transaction(s))")
 
 
-def _ym(dstr):
-    """Convert a full date string (YYYY-MM-DD) to a year-month key (YYYY-MM)."""
-    return datetime.strptime(dstr, "%Y-%m-%d").strftime("%Y-%m")
+def _ym_key(dstr):
+    """Pack a normalized YYYY-MM-DD date into an int month key (year*12 + month-1).
+
+    Int keys hash and compare faster than "YYYY-MM" strings and sort the same way.
+    """
+    return int(dstr[:4]) * 12 + int(dstr[5:7]) - 1
+
+
+def _ym_label(key):
+    """Convert a packed month key from `_ym_key` back to a "YYYY-MM" label."""
+    return f"{key // 12:04d}-{key % 12 + 1:02d}"
 
 
-def report_monthly_breakdown():
+def report_monthly_breakdown(txns=None, skipped=0):
     """Print a monthly breakdown of income, expenses, and net.
 
+    Args:
+        txns: Already-validated transactions from `_valid_transactions`.
+            Loaded fresh when omitted.
+        skipped: Number of invalid transactions dropped from `txns`.
+
     Side Effects:
         Prints a formatted report to stdout.
     """
-    txns_raw = load_transactions()
-    txns, skipped = _valid_transactions(txns_raw)
-    buckets = defaultdict(lambda: {"income": 0.0, "expense": 0.0})
+    # loaded rows are validated inside the bucketing loop, without building
+    # a cleaned copy of the list first
+    raw = txns is None
+    if raw:
+        txns, skipped = load_transactions(), 0
+    # packed month key -> [income, expense]
+    buckets = defaultdict(lambda: [0.0, 0.0])
     for t in txns:
-        ym = _ym(t["date"])
-        buckets[ym][t["type"]] += t["amount"]
+        if raw:
+            t = _normalize_transaction(t)
+            if t is None:
+                skipped += 1
+                continue
+        buckets[_ym_key(t["date"])][t["type"] == "expense"] += t["amount"]
 
     rows = sorted(buckets.items())
     print("\n------ Monthly Breakdown (Income | Expense | Net) ------")
@@ -280,12 +393,15 @@ def report_monthly_breakdown():
             print(f"(Note: skipped {skipped} invalid transaction(s))")
         return
 
-    print(" Month          Income           Expense          Net")
-    print("---------------------------------------------------------")
-    for ym, v in rows:
-        net = v["income"] - v["expense"]
-        print(
-            f"{ym}  ${v['income']:>13,.2f}  ${v['expense']:>13,.2f}  ${net:>13,.2f}")
+    # header and all rows go out in a single write
+    lines = [
+        " Month          Income           Expense          Net",
+        "---------------------------------------------------------",
+    ]
+    lines.extend(
+        f"{_ym_label(key)}  ${inc:>13,.2f}  ${exp:>13,.2f}  ${inc - exp:>13,.2f}"
+        for key, (inc, exp) in rows)
+    sys.stdout.write("\n".join(lines) + "\n")
     if skipped:
         print(f"(Note: skipped {skipped} invalid transaction(s))")
 
@@ -293,15 +409,21 @@ def report_monthly_breakdown():
 # --- CLI Menu ---
 # Main interactive menu for adding, viewing, and removing transactions, and accessing reports.
 
+_MENU_HEADER = (
+    "\n=== Expense Slasher Core ===\n"
+    "1) Add transaction\n"
+    "2) Show all transactions\n"
+    "3) Remove a transaction\n"
+    "4) Reports Menu\n"
+    "0) Exit\n"
+)
+
+
 def menu():
     """Interactive CLI menu for Expense Slasher."""
     while True:
-        print("\n=== Expense Slasher Core ===")
-        print("1) Add transaction")
-        print("2) Show all transactions")
-        print("3) Remove a transaction")
-        print("4) Reports Menu")
-        print("0) Exit")
+        # static header, built once and written in one call
+        sys.stdout.write(_MENU_HEADER)
 
         choice = input("Choose: ").strip()
 
@@ -311,8 +433,7 @@ def menu():
                 date = input(
                     "Date (YYYY-MM-DD, blank=today): ").strip() or datetime.today().strftime("%Y-%m-%d")
                 try:
-                    parsed_date = datetime.strptime(date, "%Y-%m-%d")
-                    date = parsed_date.strftime("%Y-%m-%d")  # normalize
+                    date = _normalize_date(date)  # normalize
                     break
                 except ValueError:
                     print(
@@ -325,15 +446,14 @@ def menu():
                     break
                 print("Description cannot be blank.")
 
-            # Category: cannot be blank; normalize 'food'/'Food' -> 'Food'
+            # Category: cannot be blank; known names are canonicalized (e.g. 'food' -> 'Food')
             while True:
                 category = input(
                     "Category (e.g. food, rent, utilities): ").strip()
                 if not category:
                     print("Category cannot be blank.")
                     continue
-                if category.lower() == "food":
-                    category = "Food"
+                category = _CAT_CANONICAL.get(category.lower(), category)
                 break
 
             # Amount: cannot be blank and must be numeric
@@ -368,8 +488,8 @@ def menu():
 
         elif choice == "2":  # Displays list of all transactions
             txns = load_transactions()
-            for t in txns:
-                print(t)
+            if txns:
+                sys.stdout.write("\n".join(map(str, txns)) + "\n")
 
         elif choice == "3":  # Add Modifications
             txns = load_transactions()
@@ -381,7 +501,7 @@ def menu():
             except ValueError:
                 print("Index must be a number.")
                 continue
-            ok, info = remove_transaction_by_index(idx)
+            ok, info = remove_transaction_by_index(idx, txns)
             if ok:
                 print(f"Removed: {info}")
             else:
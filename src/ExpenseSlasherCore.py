@@ -21,9 +21,11 @@ Run:
 
 from __future__ import annotations
 import sys
+from contextlib import contextmanager
+from math import fsum
 from pathlib import Path
 from typing import List, Dict, Optional
-from datetime import datetime
+from datetime import date
 
 # Bootstrap imports to ensure local modules are found
 
@@ -54,6 +56,22 @@ except ModuleNotFoundError as e:
     print("ERROR: Could not import ExpenseSlasherCLI. Ensure 'ExpenseSlasherCLI.py' is alongside this file.")
     raise e
 
+# Cached result of load_transactions(); cleared by every write
+_txn_cache: Optional[List[Dict]] = None
+
+# (db.DB.total_changes, PRAGMA data_version) when the caches were filled;
+# total_changes moves on with any write through this connection (Core or
+# direct db_handler calls), data_version with commits from other connections
+_cache_version: tuple[int, int] = (-1, -1)
+
+# Cached report aggregates keyed by report name; cleared with _txn_cache
+_report_cache: Dict[str, object] = {}
+
+# Rows queued by add_transaction() and ids queued by
+# remove_transaction_by_index() while inside buffered_writes()
+_pending: Optional[list] = None
+_pending_removals: Optional[set] = None
+
 # --------------------------- Helpers ----------------------------
 
 
@@ -64,7 +82,7 @@ def _today() -> str:
     Returns:
         str: Current date as a string in YYYY-MM-DD format.
     """
-    return datetime.today().strftime("%Y-%m-%d")
+    return date.today().isoformat()
 
 
 def _normalize_type(ttype: str) -> str:
@@ -80,6 +98,10 @@ def _normalize_type(ttype: str) -> str:
     Raises:
         ValueError: If `ttype` is not "income" or "expense".
     """
+    # already-clean input (the GUI combobox, batch imports) skips strip/lower;
+    # == checks identity first, so interned literals match without a compare
+    if ttype == "income" or ttype == "expense":
+        return ttype
     t = (ttype or "").strip().lower()
     if t not in ("income", "expense"):
         raise ValueError("Type must be 'income' or 'expense'")
@@ -98,10 +120,37 @@ def _extract_category(tags: Optional[str]) -> Optional[str]:
     """
     if not tags:
         return None
-    for t in tags.split(","):
-        if t.startswith("category:"):
-            return t.split(":", 1)[1]
-    return None
+    # scan in place rather than split: only the category slice is allocated
+    if tags.startswith("category:"):
+        start = 9
+    else:
+        start = tags.find(",category:")
+        if start < 0:
+            return None
+        start += 10
+    end = tags.find(",", start)
+    return tags[start:] if end < 0 else tags[start:end]
+
+
+def _row_to_dict(row: tuple) -> Dict:
+    """
+    Convert a DB row (rowid, date, desc, amnt, tags) to a transaction dictionary.
+
+    Args:
+        row (tuple): Row as returned by db_fetch_all / db_fetch_at.
+
+    Returns:
+        Dict: Transaction dictionary in the shape load_transactions() returns.
+    """
+    rid, date, desc, amnt, tags = row
+    return {
+        "id": rid,
+        "date": date,
+        "description": desc,
+        "category": _extract_category(tags) or "",
+        "amount": abs(amnt),
+        "type": "expense" if amnt >= 0 else "income"
+    }
 
 
 def _make_tags(category: Optional[str]) -> list[str]:
@@ -116,14 +165,37 @@ def _make_tags(category: Optional[str]) -> list[str]:
     """
     return [f"category:{category}"] if category else []
 
+
+def _invalidate_cache():
+    """
+    Drop the cached transaction list and report aggregates so the next
+    load re-reads the DB.
+    """
+    global _txn_cache
+    _txn_cache = None
+    _report_cache.clear()
+
+
+def _sync_cache():
+    """
+    Invalidate the caches if the DB has been written since they were filled,
+    by this connection or any other.
+    """
+    global _cache_version
+    version = (db.DB.total_changes,
+               db.DB.execute("PRAGMA data_version").fetchone()[0])
+    if version != _cache_version:
+        _invalidate_cache()
+        _cache_version = version
+
 # ---------------- Core DB-backed API ----------------
 
 # Bridge between core and db_handler. Add a transaction to the DB
 
 
-def add_transaction(date: str, description: str, category: str, amount, ttype: str):
+def _prepare_transaction(date: str, description: str, category: str, amount, ttype: str) -> tuple:
     """
-    Bridge to db_handler to add a transaction to the DB.
+    Validate user input and convert it to the row shape db_handler stores.
 
     Args:
         date (str): Transaction date in YYYY-MM-DD format. Defaults to today if empty.
@@ -132,6 +204,9 @@ def add_transaction(date: str, description: str, category: str, amount, ttype: s
         amount (float or str): Transaction amount.
         ttype (str): Transaction type ("income" or "expense").
 
+    Returns:
+        tuple: (date, description, signed amount, tags) ready for db_handler.
+
     Raises:
         ValueError: If amount is not numeric, or ttype is invalid.
     """
@@ -150,17 +225,118 @@ def add_transaction(date: str, description: str, category: str, amount, ttype: s
         amt = abs(amt)
 
     tags = _make_tags(category.strip() if category else None)
+    return d, description, amt, tags
 
-    ok = db.db_add_transaction(d, description, amt, tags)
+
+def add_transaction(date: str, description: str, category: str, amount, ttype: str):
+    """
+    Bridge to db_handler to add a transaction to the DB.
+
+    Args:
+        date (str): Transaction date in YYYY-MM-DD format. Defaults to today if empty.
+        description (str): Short description of the transaction.
+        category (str): Transaction category (e.g., "food", "rent").
+        amount (float or str): Transaction amount.
+        ttype (str): Transaction type ("income" or "expense").
+
+    Raises:
+        ValueError: If amount is not numeric, or ttype is invalid.
+    """
+    row = _prepare_transaction(date, description, category, amount, ttype)
+
+    if _pending is not None:
+        _pending.append(row)
+        return
+
+    ok = db.db_add_transaction(*row)
+    _invalidate_cache()
     if not ok:
         print("DB insert failed.")
 
+
+def add_transactions(items) -> bool:
+    """
+    Add many transactions to the DB in a single commit.
+
+    Every item is validated before anything is written, so one bad row
+    rejects the whole batch.
+
+    Args:
+        items: Iterable of (date, description, category, amount, ttype) tuples,
+            with the same meaning as the add_transaction() arguments.
+
+    Returns:
+        bool: True if every transaction was stored (or queued inside
+            buffered_writes()), False if the DB write failed.
+
+    Raises:
+        ValueError: If any item has a non-numeric amount or invalid ttype.
+    """
+    rows = [_prepare_transaction(*item) for item in items]
+    if not rows:
+        return True
+
+    if _pending is not None:
+        _pending.extend(rows)
+        return True
+
+    ok = db.db_bulk_add_transaction(rows)
+    _invalidate_cache()
+    if not ok:
+        print("DB insert failed.")
+    return ok
+
+
+@contextmanager
+def buffered_writes():
+    """
+    Queue add_transaction() and remove_transaction_by_index() calls and write
+    them to the DB in one commit each on exit.
+
+    Intended for bulk entry/import loops. Indices passed to
+    remove_transaction_by_index() refer to the list as it was when the block
+    started, and removing the same transaction twice only deletes it once.
+    If the block raises, everything queued is discarded. A nested block
+    joins the outer buffer, which is written when the outermost block exits.
+
+    Example:
+        with buffered_writes():
+            for row in rows:
+                add_transaction(*row)
+    """
+    global _pending, _pending_removals
+    if _pending is not None:
+        # already buffering: queue into the outer block's containers
+        yield
+        return
+    _pending, _pending_removals = [], set()
+    try:
+        yield
+        rows, removals = _pending, _pending_removals
+    finally:
+        _pending = _pending_removals = None
+
+    if removals:
+        ok = db.db_bulk_remove_transaction(list(removals))
+        _invalidate_cache()
+        if not ok:
+            print("DB delete failed.")
+    if rows:
+        ok = db.db_bulk_add_transaction(rows)
+        _invalidate_cache()
+        if not ok:
+            print("DB insert failed.")
+
 # fetch all transactions from DB and convert to list of dicts for CLI
 
 
 def load_transactions() -> List[Dict]:
     """
     Fetch all transactions from the DB and convert to a list of dictionaries.
+
+    The list is cached between calls until the next write to the DB, so
+    callers must treat it as read-only.
+
     Returns:
         List[Dict]: A list of transaction dictionaries, each containing:
             - id (int): Transaction ID.
@@ -170,73 +346,111 @@ def load_transactions() -> List[Dict]:
             - amount (float): Transaction amount (always positive).
             - type (str): "income" or "expense".
     """
-    rows = db.db_fetch_all()  # list of tuples (rowid, date, desc, amnt, tags)
-    out: List[Dict] = []
-    for rid, date, desc, amnt, tags in rows:
-        ttype = "expense" if amnt >= 0 else "income"
-        category = _extract_category(tags)
-        out.append({
+    global _txn_cache
+    _sync_cache()
+    if _txn_cache is not None:
+        return _txn_cache
+
+    rows = db.db_iter_all()  # streamed tuples (rowid, date, desc, amnt, tags)
+    # same shape as _row_to_dict(), inlined to skip a function call per row
+    out: List[Dict] = [
+        {
             "id": rid,
             "date": date,
             "description": desc,
-            "category": category or "",
+            "category": _extract_category(tags) or "",
             "amount": abs(amnt),
-            "type": ttype
-        })
+            "type": "expense" if amnt >= 0 else "income"
+        }
+        for rid, date, desc, amnt, tags in rows
+    ]
+    _txn_cache = out
     return out
 
 # Compute total income, expenses, net savings, net value from list of transactions
 
 
-def total_income(transactions: List[Dict]) -> float:
+def summarize(transactions: Optional[List[Dict]] = None) -> tuple[float, float, float]:
+    """
+    Calculate total income, total expenses, and net savings in a single pass.
+
+    Args:
+        transactions (Optional[List[Dict]]): List of transaction dictionaries.
+            When omitted, the totals are aggregated by the DB (and cached until
+            the next write) without loading any rows.
+
+    Returns:
+        tuple[float, float, float]: (income, expenses, net savings).
+    """
+    if transactions is None:
+        _sync_cache()
+        if "totals" not in _report_cache:
+            inc_total, exp_total = db.db_fetch_totals()
+            _report_cache["totals"] = (inc_total, exp_total, inc_total - exp_total)
+        return _report_cache["totals"]
+
+    amounts: Dict[str, List[float]] = {"income": [], "expense": []}
+    for t in transactions:
+        bucket = amounts.get(t.get("type"))
+        if bucket is not None:
+            bucket.append(float(t.get("amount", 0.0)))
+    inc_total, exp_total = fsum(amounts["income"]), fsum(amounts["expense"])
+    return inc_total, exp_total, inc_total - exp_total
+
+
+def total_income(transactions: Optional[List[Dict]] = None) -> float:
     """
     Calculate the total income from a list of transactions.
 
     Args:
-        transactions (List[Dict]): List of transaction dictionaries.
+        transactions (Optional[List[Dict]]): List of transaction dictionaries.
+            When omitted, the DB aggregates every stored transaction.
 
     Returns:
         float: Sum of all income transaction amounts.
     """
-    return sum(float(t["amount"]) for t in transactions if t["type"] == "income")
+    return summarize(transactions)[0]
 
 
-def total_expenses(transactions: List[Dict]) -> float:
+def total_expenses(transactions: Optional[List[Dict]] = None) -> float:
     """
     Calculate the total expenses from a list of transactions.
 
     Args:
-        transactions (List[Dict]): List of transaction dictionaries.
+        transactions (Optional[List[Dict]]): List of transaction dictionaries.
+            When omitted, the DB aggregates every stored transaction.
 
     Returns:
         float: Sum of all expense transaction amounts.
     """
-    return sum(float(t["amount"]) for t in transactions if t["type"] == "expense")
+    return summarize(transactions)[1]
 
 
-def net_savings(transactions: List[Dict]) -> float:
+def net_savings(transactions: Optional[List[Dict]] = None) -> float:
     """
     Calculate the net savings from a list of transactions.
 
     Net savings = income - expenses.
 
     Args:
-        transactions (List[Dict]): List of transaction dictionaries.
+        transactions (Optional[List[Dict]]): List of transaction dictionaries.
+            When omitted, the DB aggregates every stored transaction.
 
     Returns:
         float: Net savings value.
     """
-    return total_income(transactions) - total_expenses(transactions)
+    return summarize(transactions)[2]
 
 
-def net_value(transactions: List[Dict]) -> float:
+def net_value(transactions: Optional[List[Dict]] = None) -> float:
     """
     Calculate the net financial value from a list of transactions.
 
     Alias for net_savings().
 
     Args:
-        transactions (List[Dict]): List of transaction dictionaries.
+        transactions (Optional[List[Dict]]): List of transaction dictionaries.
+            When omitted, the DB aggregates every stored transaction.
 
     Returns:
         float: Net financial value.
@@ -244,12 +458,42 @@ def net_value(transactions: List[Dict]) -> float:
     return net_savings(transactions)
 
 
-def remove_transaction_by_index(index: int):
+def expenses_by_category() -> List[tuple[str, float]]:
+    """
+    Total expenses per category, aggregated by the DB and cached until the next write.
+
+    Returns:
+        List[tuple[str, float]]: (category, total) pairs sorted by total descending.
+            Uncategorized expenses use an empty category string.
+    """
+    _sync_cache()
+    if "category" not in _report_cache:
+        _report_cache["category"] = db.db_fetch_category_totals()
+    return _report_cache["category"]
+
+
+def monthly_breakdown() -> List[tuple[str, float, float]]:
+    """
+    Income and expense totals per month, aggregated by the DB and cached until the next write.
+
+    Returns:
+        List[tuple[str, float, float]]: (YYYY-MM, income, expense) rows sorted by month.
+    """
+    _sync_cache()
+    if "monthly" not in _report_cache:
+        _report_cache["monthly"] = db.db_fetch_monthly_totals()
+    return _report_cache["monthly"]
+
+
+def remove_transaction_by_index(index: int, txns: Optional[List[Dict]] = None):
     """
     Remove a transaction by its index in the transaction list.
 
     Args:
         index (int): Zero-based index of the transaction in the list.
+        txns (Optional[List[Dict]]): The list the index refers to, if the caller
+            already loaded it. Defaults to the cached list, or a direct DB
+            lookup of that single row when nothing is loaded yet.
 
     Returns:
         tuple:
@@ -257,36 +501,58 @@ def remove_transaction_by_index(index: int):
             - (dict or int): Removed transaction dict if successful,
               or the number of transactions if removal failed.
     """
-    txns = load_transactions()
-    if index < 0 or index >= len(txns):
-        return False, len(txns)
-
-    target = txns[index]
+    if txns is None:
+        _sync_cache()
+        txns = _txn_cache
+
+    def count() -> int:
+        # size of the list the index refers to, for the CLI's range message
+        return len(txns) if txns is not None else db.db_fetch_count()
+
+    if txns is None:
+        # nothing loaded yet: seek just the one row instead of the whole table
+        row = db.db_fetch_at(index)
+        if row is None:
+            return False, count()
+        target = _row_to_dict(row)
+    elif index < 0 or index >= len(txns):
+        return False, count()
+    else:
+        target = txns[index]
     tid = target.get("id")
     if tid is None:
         # return the number of transactions so CLI can show range
-        return False, len(txns)
+        return False, count()
+
+    if _pending_removals is not None:
+        # inside buffered_writes(): delete on exit, once per id
+        _pending_removals.add(tid)
+        return True, target
 
     if hasattr(db, "db_delete_transaction") and callable(db.db_delete_transaction):
         ok = db.db_delete_transaction(tid)
+        _invalidate_cache()
         if ok:
             return True, target
         else:
             # deletion failed, but return count so CLI doesn’t break
-            return False, len(txns)
+            return False, count()
     else:
         # deletion not implemented, return count
-        return False, len(txns)
+        return False, count()
 
 
 # ---------------- Bind Core into CLI ----------------
 # This overwrites CLI CSV based functions with CORE DB functions
 cli.add_transaction = add_transaction
 cli.load_transactions = load_transactions
+cli.summarize = summarize
 cli.total_income = total_income
 cli.total_expenses = total_expenses
 cli.net_savings = net_savings
 cli.net_value = net_value
+cli.expenses_by_category = expenses_by_category
+cli.monthly_breakdown = monthly_breakdown
 cli.remove_transaction_by_index = remove_transaction_by_index
 
 # ---------------- Runner ----------------
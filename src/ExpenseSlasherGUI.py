@@ -16,11 +16,14 @@ those injected functions—so the Core remains your entry point.
 Expected to be overwritten by the Core after import:
 - add_transaction(date, description, category, amount, ttype)
 - load_transactions() -> list[dict]
-- remove_transaction_by_index(index: int) -> tuple[bool, dict|int]
-- total_income(transactions) -> float
-- total_expenses(transactions) -> float
-- net_savings(transactions) -> float
-- net_value(transactions) -> float
+- summarize(transactions=None) -> tuple[float, float, float]
+- remove_transaction_by_index(index: int, txns=None) -> tuple[bool, dict|int]
+- total_income(transactions=None) -> float
+- total_expenses(transactions=None) -> float
+- net_savings(transactions=None) -> float
+- net_value(transactions=None) -> float
+- expenses_by_category() -> list[tuple[str, float]]
+- monthly_breakdown() -> list[tuple[str, float, float]]
 """
 
 
@@ -73,13 +76,16 @@ def load_transactions() -> List[Dict]:
     return []
 
 
-def remove_transaction_by_index(index: int):
+def remove_transaction_by_index(index: int, txns: List[Dict] | None = None):
     """Remove a transaction by its 0‑based index.
 
     Parameters
     ----------
     index : int
         Index in the current transaction list/order.
+    txns : List[Dict] | None, optional
+        The list ``index`` refers to when the caller already holds it, so the
+        Core can skip reloading.
 
     Returns
     -------
@@ -94,7 +100,18 @@ def remove_transaction_by_index(index: int):
     return False, 0
 
 
-def total_income(transactions: List[Dict]) -> float:
+def summarize(transactions: List[Dict] | None = None) -> tuple[float, float, float]:
+    """Compute ``(income, expense, net)`` totals in a single pass.
+
+    When ``transactions`` is omitted the Core aggregates every stored
+    transaction without materializing the rows.
+
+    Placeholder returns ``(0.0, 0.0, 0.0)`` when Core is not connected.
+    """
+    return 0.0, 0.0, 0.0
+
+
+def total_income(transactions: List[Dict] | None = None) -> float:
     """Compute the sum of amounts for transactions with type ``income``.
 
     Placeholder returns ``0.0`` when Core is not connected.
@@ -102,7 +119,7 @@ def total_income(transactions: List[Dict]) -> float:
     return 0.0
 
 
-def total_expenses(transactions: List[Dict]) -> float:
+def total_expenses(transactions: List[Dict] | None = None) -> float:
     """Compute the sum of amounts for transactions with type ``expense``.
 
     Placeholder returns ``0.0`` when Core is not connected.
@@ -110,7 +127,7 @@ def total_expenses(transactions: List[Dict]) -> float:
     return 0.0
 
 
-def net_savings(transactions: List[Dict]) -> float:
+def net_savings(transactions: List[Dict] | None = None) -> float:
     """Compute savings metric if provided by Core (not used directly here).
 
     Placeholder returns ``0.0``.
@@ -118,12 +135,29 @@ def net_savings(transactions: List[Dict]) -> float:
     return 0.0
 
 
-def net_value(transactions: List[Dict]) -> float:
+def net_value(transactions: List[Dict] | None = None) -> float:
     """Compute net value metric if provided by Core (not used directly here).
 
     Placeholder returns ``0.0``.
     """
     return 0.0
+
+
+def expenses_by_category() -> List[tuple[str, float]]:
+    """Return ``(category, total)`` expense sums sorted by total descending.
+
+    A blank category groups uncategorized expenses. Placeholder returns an
+    empty list.
+    """
+    return []
+
+
+def monthly_breakdown() -> List[tuple[str, float, float]]:
+    """Return ``(YYYY-MM, income, expense)`` sums sorted by month.
+
+    Placeholder returns an empty list.
+    """
+    return []
 # -----------------------------------------------------------
 
 
@@ -161,11 +195,6 @@ def _parse_amount(s: str) -> float:
         raise ValueError("Amount must be numeric.")
 
 
-def _ym(dstr: str) -> str:
-    """Return ``YYYY-MM`` month key from a ``YYYY-MM-DD`` date string."""
-    return datetime.strptime(dstr, "%Y-%m-%d").strftime("%Y-%m")
-
-
 class ExpenseSlasherGUI(tk.Tk):
     """Main application window for Expense Slasher.
 
@@ -351,7 +380,7 @@ class ExpenseSlasherGUI(tk.Tk):
             messagebox.showinfo("Remove", "Select a row to remove.")
             return
         idx = int(self.tree.set(sel[0], "idx"))  # 0-based index
-        ok, info = remove_transaction_by_index(idx)
+        ok, info = remove_transaction_by_index(idx, self._txns)
         if ok:
             messagebox.showinfo("Removed", f"Removed: {info}")
         else:
@@ -363,10 +392,14 @@ class ExpenseSlasherGUI(tk.Tk):
 
     # ---------- Data/Display ----------
     def _refresh_table(self):
-        """Reload the transactions from storage and repopulate the table."""
+        """Reload the transactions from storage and repopulate the table.
+
+        The loaded list is kept on ``self._txns`` so row indices can be
+        resolved against exactly what is displayed.
+        """
         for i in self.tree.get_children():
             self.tree.delete(i)
-        txns = load_transactions()
+        txns = self._txns = load_transactions()
         for i, t in enumerate(txns):
             self.tree.insert("", "end", values=(
                 i,
@@ -379,10 +412,7 @@ class ExpenseSlasherGUI(tk.Tk):
 
     def _update_totals(self):
         """Recalculate and display Income, Expenses, and Net totals."""
-        txns = load_transactions()
-        inc = total_income(txns)
-        exp = total_expenses(txns)
-        net = inc - exp
+        inc, exp, net = summarize()
         self.lbl_income.config(text=f"Income: ${inc:,.2f}")
         self.lbl_expense.config(text=f"Expenses: ${exp:,.2f}")
         self.lbl_net.config(text=f"Net: ${net:,.2f}")
@@ -443,10 +473,7 @@ class ExpenseSlasherGUI(tk.Tk):
     # ---------- Reports ----------
     def _open_report_income_vs_expenses(self):
         """Open a window with overall Income vs. Expense totals and a bar chart."""
-        txns = load_transactions()
-        inc = total_income(txns)
-        exp = total_expenses(txns)
-        net = inc - exp
+        inc, exp, net = summarize()
 
         win = tk.Toplevel(self)
         win.title("Income vs. Expenses")
@@ -490,20 +517,13 @@ class ExpenseSlasherGUI(tk.Tk):
 
     def _open_report_expenses_by_category(self):
         """Open a window listing expense totals by category plus a bar chart."""
-        from collections import defaultdict
-        txns = load_transactions()
-        by_cat = defaultdict(float)
-
-        for t in txns:
-            if str(t.get("type", "")).lower() == "expense":
-                cat = (t.get("category") or "").strip() or "Uncategorized"
-                try:
-                    amt = float(t.get("amount", 0))
-                except (TypeError, ValueError):
-                    amt = 0.0
-                by_cat[cat] += amt
-
-        rows = sorted(by_cat.items(), key=lambda kv: kv[1], reverse=True)
+        # blank and literal "Uncategorized" (or names differing only by
+        # whitespace) share one display label, so merge them under it
+        by_label: Dict[str, float] = {}
+        for cat, total in expenses_by_category():
+            label = cat.strip() or "Uncategorized"
+            by_label[label] = by_label.get(label, 0.0) + total
+        rows = sorted(by_label.items(), key=lambda kv: kv[1], reverse=True)
 
         win = tk.Toplevel(self)
         win.title("Expenses by Category")
@@ -562,23 +582,7 @@ class ExpenseSlasherGUI(tk.Tk):
 
     def _open_report_monthly_breakdown(self):
         """Open a window with month buckets and a grouped monthly bar chart."""
-        from collections import defaultdict
-        txns = load_transactions()
-        buckets = defaultdict(lambda: {"income": 0.0, "expense": 0.0})
-
-        for t in txns:
-            try:
-                ym = _ym(t["date"])
-            except Exception:
-                # Skip malformed dates silently in the report
-                continue
-            amt = float(t.get("amount", 0) or 0)
-            if t.get("type") == "income":
-                buckets[ym]["income"] += amt
-            elif t.get("type") == "expense":
-                buckets[ym]["expense"] += amt
-
-        rows = sorted(buckets.items())  # (ym, dict)
+        rows = monthly_breakdown()  # (ym, income, expense)
 
         win = tk.Toplevel(self)
         win.title("Monthly Breakdown (Income | Expense | Net)")
@@ -612,13 +616,13 @@ class ExpenseSlasherGUI(tk.Tk):
         table_frame.columnconfigure(0, weight=1)
 
         months, incomes, expenses = [], [], []
-        for ym, v in rows:
-            net = v["income"] - v["expense"]
+        for ym, inc, exp in rows:
+            net = inc - exp
             tree.insert("", "end", values=(
-                ym, f"${v['income']:,.2f}", f"${v['expense']:,.2f}", f"${net:,.2f}"))
+                ym, f"${inc:,.2f}", f"${exp:,.2f}", f"${net:,.2f}"))
             months.append(ym)
-            incomes.append(v["income"])
-            expenses.append(v["expense"])
+            incomes.append(inc)
+            expenses.append(exp)
 
         # Bottom: chart (bar chart per month)
         chart_frame = ttk.LabelFrame(frm, text="Monthly Bar Chart")
@@ -21,6 +21,8 @@
 import sqlite3 #SQLite3 for Database
 import sys #sys for importing CLI arguments
 import os #os for automated DB clearing during debug
+import atexit #atexit for closing the shared connection on shutdown
+from typing import Iterator #Iterator for streamed fetch return types
 
 #TODO - Transaction template
 
@@ -28,11 +30,22 @@ import os #os for automated DB clearing during debug
 DB = None #DB variable
 CURSOR = None #DB Cursor variable
 
+#db_fetch_set range symbols mapped to their inclusive SQL comparison
+_AMNT_RANGE_OPS = {'-': '<=', '<': '<=', '+': '>=', '>': '>='}
+
+#bulk adds at least this large re-ANALYZE so the planner sees the new data
+_ANALYZE_BATCH_SIZE = 1000
+
+#most ? parameters bound in one IN (...) list; older SQLite builds reject
+#statements with more than 999 variables
+_MAX_SQL_VARS = 999
+
 
 def db_init(db_name: str = "data.db"):
     """Intializes the database with default name or function provided name
        Attempts to create the base table with rows and cols and gracefully
-       skips if the database w/ the table already exists
+       skips if the database w/ the table already exists, so indexes added
+       later are still created on existing database files
 
     Args:
         db_name (str, optional): File name for database; Defaults to "data.db".
@@ -50,48 +63,114 @@ def db_init(db_name: str = "data.db"):
     try:
         #enabling foreign keys for cascading deletions
         CURSOR.execute ("PRAGMA foreign_keys = ON;")
-        #transaction table
-        CURSOR.execute("""
-            CREATE TABLE transactions (
+        #memory-map up to 256MB of the db file so reads skip the extra copy
+        #through SQLite's page cache
+        CURSOR.execute ("PRAGMA mmap_size = 268435456;")
+        #write-ahead logging: commits append to the WAL instead of rewriting
+        #the journal, and readers no longer block on the writer
+        CURSOR.execute ("PRAGMA journal_mode = WAL;")
+        #NORMAL is durable under WAL and skips the fsync on every commit
+        CURSOR.execute ("PRAGMA synchronous = NORMAL;")
+        #keep temp b-trees (GROUP BY/ORDER BY) in memory, use an 8MB page
+        #cache, and wait up to 5s on a locked db instead of failing
+        CURSOR.execute ("PRAGMA temp_store = MEMORY;")
+        CURSOR.execute ("PRAGMA cache_size = -8192;")
+        CURSOR.execute ("PRAGMA busy_timeout = 5000;")
+        #schema is created in ONE script and ONE transaction; python's sqlite3
+        #leaves DDL in autocommit, so separate executes would commit (and
+        #sync) once per statement on a fresh database file
+        CURSOR.executescript("""
+            BEGIN;
+            
+            -- transaction table
+            CREATE TABLE IF NOT EXISTS transactions (
                 transaction_id INTEGER PRIMARY KEY,
                 date TEXT,
                 desc TEXT,
                 amnt REAL
             );
-        """)
-        
-        #tag table
-        CURSOR.execute("""
-            CREATE TABLE tags (
+            
+            -- tag table
+            CREATE TABLE IF NOT EXISTS tags (
                 tag_id INTEGER PRIMARY KEY,
                 name TEXT UNIQUE
             );
-        """)
-        
-        #transaction_tag joint table
-        CURSOR.execute("""
-            CREATE TABLE transactions_tags (
+            
+            -- transaction_tag joint table
+            CREATE TABLE IF NOT EXISTS transactions_tags (
                 transaction_id INTEGER NOT NULL, 
                 tag_id INTEGER NOT NULL, 
                 FOREIGN KEY (transaction_id) REFERENCES transactions(transaction_id) ON DELETE CASCADE,
                 FOREIGN KEY (tag_id) REFERENCES tags (tag_id) ON DELETE CASCADE,
                 UNIQUE (transaction_id, tag_id)
             );
+            
+            -- covering index on date/ammount so date lookups and the monthly
+            -- aggregate read the index instead of the whole table
+            CREATE INDEX IF NOT EXISTS idx_transactions_date
+            ON transactions (date, amnt);
+            
+            -- index on amount for db_fetch_set's exact/range amount filters
+            CREATE INDEX IF NOT EXISTS idx_transactions_amnt
+            ON transactions (amnt);
+            
+            -- covering index on the joint table's tag side, so tag filters
+            -- and the orphan-tag trigger never touch the table itself; the
+            -- transaction side is covered by the UNIQUE (transaction_id,
+            -- tag_id) index already
+            CREATE INDEX IF NOT EXISTS idx_transactions_tags_tag
+            ON transactions_tags (tag_id, transaction_id);
+            
+            -- tags can NOT exist without a transaction, so whenever a link
+            -- is removed (directly or by cascade) drop its tag if it was the
+            -- last one
+            CREATE TRIGGER IF NOT EXISTS trg_prune_orphan_tag
+            AFTER DELETE ON transactions_tags
+            WHEN NOT EXISTS (
+                SELECT 1 FROM transactions_tags WHERE tag_id = OLD.tag_id
+            )
+            BEGIN
+                DELETE FROM tags WHERE tag_id = OLD.tag_id;
+            END;
+            
+            COMMIT;
         """)
-        DB.commit() #commit changes to database
     except sqlite3.OperationalError as e:
         #prints error message if unable to create database tables
         print("Error Creating Tables...")
         print(e)
+        #a failed script leaves its transaction open
+        if DB.in_transaction:
+            DB.rollback()
 
-def db_fetch_all () -> list[tuple[int,str,str,float,str]]:
-    """Fetches all transactions from database, linking them with the appropriate
-    tags
+def db_close ():
+    """Closes the module's database connection, if one is open. Registered to
+    run at interpreter exit so the single shared connection is closed cleanly
+    instead of relying on garbage collection
+    """
+    global DB
+    global CURSOR
+    
+    if DB is not None:
+        #let SQLite refresh planner statistics (ANALYZE) for any table whose
+        #indexes were used heavily this session, so filters keep choosing
+        #the tag/date/amount indexes as the data grows
+        try:
+            DB.execute("PRAGMA optimize;")
+        except sqlite3.Error as e:
+            print("Error optimizing database: ",e)
+        DB.close()
+    DB = None
+    CURSOR = None
+
+def db_iter_all () -> Iterator[tuple[int,str,str,float,str]]:
+    """Streams all transactions from database, linking them with the
+    appropriate tags, one row at a time instead of building a list. Rows come
+    from their own cursor, so other db calls made while iterating are safe
 
     Returns:
-        list[tuple[int,str,str,float,str]]: list of transaction details
-    """    
-    fetch = []
+        Iterator[tuple[int,str,str,float,str]]: transaction details
+    """
 #        First we grab all the cols in transaction table and a col which lists
 #        all the Tag names in a list related to a single transaction
 #        
@@ -105,18 +184,24 @@ def db_fetch_all () -> list[tuple[int,str,str,float,str]]:
 #        merge duplicate transaction records' tags into a single entry with a
 #        list of its matching tags and outputs that single transaction record
 
-    #db query to grab and link tables
-    CURSOR.execute("""
+    #db query to grab and link tables; the cursor itself yields the rows
+    return DB.execute("""
         SELECT T.ROWID, T.date, T.desc, T.amnt, GROUP_CONCAT(Tag.name) as tags
         FROM transactions as T
         LEFT JOIN transactions_tags as JT on T.ROWID = JT.transaction_id
         LEFT JOIN tags as Tag On JT.tag_id = Tag.ROWID
         GROUP BY T.ROWID
         """)
-    #pulls results from cursor
-    fetch = CURSOR.fetchall()
-    #returns fetched data
-    return fetch
+
+def db_fetch_all () -> list[tuple[int,str,str,float,str]]:
+    """Fetches all transactions from database, linking them with the appropriate
+    tags
+
+    Returns:
+        list[tuple[int,str,str,float,str]]: list of transaction details
+    """    
+    #pulls every row of the streamed query at once
+    return db_iter_all().fetchall()
   
 def db_fetch_all_tagless () -> list[tuple[int,str,str,float]]:
     """Fetches all transactions in transaction table and retuns list of tuples
@@ -125,17 +210,119 @@ def db_fetch_all_tagless () -> list[tuple[int,str,str,float]]:
     Returns:
         list[tuple[int,str,str,float]]: list of tuples representing transactions
     """    
-    fetch = []
-    #SQL query grabs all data in transaction table
-    #for row in iterates through each entry pulled by SQL query and appends to 
-    #fetch object
-    for row in CURSOR.execute("""
+    #SQL query grabs all data in transaction table; fetchall builds the list
+    #in C rather than appending row by row
+    CURSOR.execute("""
             SELECT ROWID, date, desc, amnt 
             FROM transactions 
             ORDER BY ROWID
-    """):
-        fetch.append(row)
-    return fetch
+    """)
+    return CURSOR.fetchall()
+
+def db_fetch_at (index: int) -> tuple[int,str,str,float,str]|None:
+    """Fetches the transaction at a position in db_fetch_all's order (by ROWID)
+    without materializing the rest of the table
+
+    Args:
+        index (int): zero-based position of the transaction
+
+    Returns:
+        tuple[int,str,str,float,str]|None: transaction details with its tags,
+        or None if index is out of range
+    """
+    if index < 0:
+        return None
+    #seeks the rowid by offset on the primary key, then links only that row
+    CURSOR.execute("""
+        SELECT T.ROWID, T.date, T.desc, T.amnt, GROUP_CONCAT(Tag.name) as tags
+        FROM transactions as T
+        LEFT JOIN transactions_tags as JT on T.ROWID = JT.transaction_id
+        LEFT JOIN tags as Tag On JT.tag_id = Tag.ROWID
+        WHERE T.ROWID = (SELECT ROWID FROM transactions
+                         ORDER BY ROWID LIMIT 1 OFFSET ?)
+        GROUP BY T.ROWID
+        """, (index,))
+    return CURSOR.fetchone()
+
+def db_fetch_count () -> int:
+    """Fetches the number of transactions in the database
+
+    Returns:
+        int: count of transactions
+    """
+    CURSOR.execute("SELECT COUNT(*) FROM transactions")
+    return CURSOR.fetchone()[0]
+
+def _db_chunks (items: tuple) -> Iterator[tuple]:
+    """private, helper function that splits a parameter tuple into slices
+    small enough to bind in a single IN (...) list. not intended to be called
+    outside of db_handler
+
+    Args:
+        items (tuple): parameters to split
+
+    Yields:
+        tuple: consecutive slices of at most _MAX_SQL_VARS items
+    """
+    for start in range(0, len(items), _MAX_SQL_VARS):
+        yield items[start:start + _MAX_SQL_VARS]
+
+def _db_insert_transaction (date: str, desc: str, amnt: float, tags:list[str]) -> int:
+    """private, helper function that inserts a single transaction and links its
+    tags WITHOUT committing, so callers can group several inserts into one
+    commit. not intended to be called outside of db_handler
+
+    Args:
+        date (str): Date of transaction in format YYYY-MM-DD
+        desc (str): Description of transaction
+        amnt (float): Ammount for transaction, debits positive/credits negative
+        tags (list[str]): Array of strings containing tags for sorting
+
+    Returns:
+        int: transaction id of the new entry
+    """
+    #insert to transaction table
+    #format data for parametric SQL query
+    entryData = (date,desc,amnt)
+    #executes sql query
+    CURSOR.execute("""
+        INSERT INTO transactions (date,desc,amnt)
+        VALUES (?,?,?)
+    """, entryData)
+    #grabs transaction id as it is the last one in table
+    trans_id = CURSOR.lastrowid
+    
+    #insert to tags table and link them
+    _db_link_tags(trans_id, tags)
+    return trans_id
+
+def _db_link_tags (transactionID: int, tags: list[str]):
+    """private, helper function that links a transaction to a list of tags,
+    adding any tags not yet in the tag table, WITHOUT committing. runs a fixed
+    number of statements regardless of tag count. not intended to be called
+    outside of db_handler
+
+    Args:
+        transactionID (int): transaction id to link the tags to
+        tags (list[str]): list of tag names, duplicates and existing links
+            are ignored
+    """
+    if not tags:
+        return
+    #add any tags not already in tag table; existing names are skipped by
+    #the UNIQUE constraint instead of a lookup per tag
+    CURSOR.executemany("INSERT OR IGNORE INTO tags (name) VALUES (?)",
+                       [(tag,) for tag in tags])
+    
+    #link the transaction to every tag id in one statement
+    tmp = ','.join('?' * len(tags))
+    CURSOR.execute(f"""
+        INSERT OR IGNORE INTO transactions_tags (transaction_id,tag_id)
+        SELECT ?, tag_id
+        FROM tags
+        WHERE name
+        IN ({tmp})
+    """, (transactionID, *tags))
 
 def db_add_transaction (date: str, desc: str, amnt: float, tags:list[str]) -> bool:
     """Database function to add a single transaction to the database
@@ -151,34 +338,8 @@ def db_add_transaction (date: str, desc: str, amnt: float, tags:list[str]) -> bo
         bool: Returns True/False based on successful database entry
     """    
     try:
-        #insert to transaction table
-        #format data for parametric SQL query
-        entryData = (date,desc,amnt)
-        #executes sql query
-        CURSOR.execute("""
-            INSERT INTO transactions (date,desc,amnt)
-            VALUES (?,?,?)
-        """, entryData)
-        #grabs transaction id as it is the last one in table
-        trans_id = CURSOR.lastrowid
-        
-        #insert to tags table
-        for tag in tags:
-            #see if tag exists in tag table
-            CURSOR.execute("SELECT ROWID FROM tags WHERE name = ?", (tag,))
-            tagSearchRes = CURSOR.fetchone()
-
-            if tagSearchRes: #if tag exists
-                tag_id = tagSearchRes[0] #set tag_id to that id
-            else:#else, insert new entry to tag table and get tag id
-                CURSOR.execute("INSERT INTO tags (name) VALUES (?)", (tag,))
-                tag_id = CURSOR.lastrowid
-            
-            #insert to trans_tags table
-            CURSOR.execute("""
-                INSERT INTO transactions_tags (transaction_id,tag_id)
-                VALUES (?,?)
-            """, (trans_id,tag_id))
+        #insert transaction and its tags
+        _db_insert_transaction(date, desc, amnt, tags)
         #commit changes to db
         DB.commit()
     except sqlite3.Error as e:
@@ -230,42 +391,42 @@ def db_fetch_set (date:str = None,
         """
     params = []
     
-    #dynamically appending to query if search criteria exists
-    if date is not None:
-        query += " AND T.date = ?"
-        params.append(date)
-    if desc is not None:
-        query += " and T.desc LIKE ?"
-        params.append(f"%{desc}%")
-    if amnt is not None:
-        #checks if single float or tuple for range
-        if type(amnt) == float:
-            query += " and amnt = ?"
-            params.append(amnt)
-        else:
-            if amnt[0] == '-' or amnt[0] == '<':
-                query += " and amnt <= ?"
-            elif amnt[0] == '+' or amnt[0] == '>':
-                query += " and amnt >= ?"
-            else: #invalid tuple symbol results in exact search
+    #build the filters and run the query; a bad amount filter takes the
+    #same printed-error path as a query failure
+    try:
+        #dynamically appending to query if search criteria exists
+        if date is not None:
+            query += " AND T.date = ?"
+            params.append(date)
+        if desc is not None:
+            query += " and T.desc LIKE ?"
+            params.append(f"%{desc}%")
+        if amnt is not None:
+            #checks if tuple for range, otherwise any number (int included) is
+            #an exact search
+            if isinstance(amnt, (tuple, list)):
+                #invalid tuple symbol results in exact search
+                query += f" and amnt {_AMNT_RANGE_OPS.get(amnt[0], '=')} ?"
+                params.append(amnt[1])
+            else:
                 query += " and amnt = ?"
-            params.append(amnt[1])
-    if tags: #dymaically appends tags for parametric sql query
-        tmp = ','.join(['?'] * len(tags))
-        query += f" AND Tag.name IN ({tmp})"
-        params.extend(tags)
+                params.append(float(amnt))
+        if tags: #dymaically appends tags for parametric sql query
+            tmp = ','.join(['?'] * len(tags))
+            query += f" AND Tag.name IN ({tmp})"
+            params.extend(tags)
     
-    #additional condition to organize results by rowid    
-    query += """
-        GROUP BY
-            T.ROWID
-    """
-    #attempt query execution and return data if successful    
-    try:
+        #additional condition to organize results by rowid    
+        query += """
+            GROUP BY
+                T.ROWID
+        """
+        #attempt query execution and return data if successful    
         CURSOR.execute(query,tuple(params))
         return CURSOR.fetchall()
-    except sqlite3.Error as e:
-        #catches error and prints error to console
+    except (sqlite3.Error, TypeError, ValueError) as e:
+        #catches error (including a non-numeric amount filter) and prints
+        #error to console
         print("DB Error: ",e)
 
 def db_edit_transaction (transactionID: int,
@@ -342,23 +503,9 @@ def db_add_transaction_tags (transactionID: int, tags: list[str] = None) -> bool
     #checks for empty tag list   
     if tags is not None:
         try:
-            for tag in tags:
-                #First search tags table if tag exists
-                CURSOR.execute("SELECT ROWID FROM tags WHERE name = ?", (tag,))
-                res = CURSOR.fetchone()
-                
-                #if tag found, grab id, if not, insert and grab new id
-                if res:
-                    tag_id = res[0]
-                else:
-                    CURSOR.execute("INSERT INTO tags (name) VALUES (?)", (tag,))
-                    tag_id = CURSOR.lastrowid
-                
-                #then link transaction to tag in joint table
-                CURSOR.execute("""
-                    INSERT OR IGNORE INTO transactions_tags (transaction_id, tag_id)
-                    VALUES (?,?)
-                """, (transactionID,tag_id))
+            #add missing tags and link transaction to all of them in joint
+            #table
+            _db_link_tags(transactionID, tags)
             #attempt to commit to database
             DB.commit()
             print(f"Tags for Transaction ID: {transactionID} added successfully!")
@@ -392,34 +539,18 @@ def db_delete_transaction_tags (transactionID: int, tags: list[str] = None) -> b
     #checks for tags in tag list
     if tags is not None:
         try:
-            for tag in tags:
-                #checks for entries in joint table with tag name
-                CURSOR.execute("SELECT ROWID FROM tags WHERE name = ?",(tag,))
-                res = CURSOR.fetchone()
-                
-                #if tag exists, remove relational entry
-                if res:
-                    tag_id = res[0]
-                    
-                    CURSOR.execute("""
-                        DELETE FROM transactions_tags
-                        WHERE transaction_id = ? AND tag_id = ?
-                    """,(transactionID,tag_id))
-                    
-                    #check if tag has no other transactions relating to it
-                    #AKA orphaned tags
-                    CURSOR.execute("""
-                        SELECT COUNT(*) FROM transactions_tags
-                        WHERE tag_id = ?
-                        """,(tag_id,))
-                    otherLinks = CURSOR.fetchone()[0]
-                    
-                    #if no other trans, prune tag from tag table
-                    if otherLinks == 0:
-                        CURSOR.execute("""
-                            DELETE FROM tags
-                            WHERE ROWID = ?
-                            """,(tag_id,))
+            #remove every relational entry for the named tags in one
+            #statement; names not in the tag table simply match nothing, and
+            #trg_prune_orphan_tag drops any tag left without a transaction
+            if tags:
+                tmp = ','.join('?' * len(tags))
+                CURSOR.execute(f"""
+                    DELETE FROM transactions_tags
+                    WHERE transaction_id = ?
+                    AND tag_id IN (
+                        SELECT tag_id FROM tags WHERE name IN ({tmp})
+                    )
+                """,(transactionID, *tags))
             #attempt to commit changes
             DB.commit()
             print(f"Tags for transaction ID {transactionID} removed successfully")
@@ -449,52 +580,22 @@ def db_delete_transaction (transactionID: int = None) -> bool:
     #find entry in transactions table
     if transactionID is not None:
         try:
-            #SQL query to find transaction via transaction id
+            #delete transaction; cascade clears its joint table entries and
+            #trg_prune_orphan_tag drops any tags left without a transaction
             CURSOR.execute ("""
-                SELECT ROWID 
+                DELETE
                 FROM transactions
                 WHERE ROWID = ?
                 """,(transactionID,))
-            res = CURSOR.fetchone()
-            if res:
-                #if found, delete transaction
-                CURSOR.execute ("""
-                    DELETE
-                    FROM transactions
-                    WHERE ROWID = ?
-                    """,(transactionID,))
-                
-                #THEN prune tag table for orphaned tags
-                CURSOR.execute("""
-                    SELECT T.tag_id
-                    FROM tags AS T
-                    LEFT JOIN transactions_tags AS JT
-                    ON T.tag_id = JT.tag_id
-                    WHERE JT.tag_id IS NULL
-                """)
-                orphaned_tags = CURSOR.fetchall()
-                
-                #if orphaned tags exist, prune tag table of those entries
-                if orphaned_tags:
-                    print("Orphaned tags found, pruning...")
-                    #creates list of orphaned tag ids
-                    orphaned_ids = [tag[0] for tag in orphaned_tags]
-                    
-                    #creates object for parametric queries
-                    tmp = ','.join('?' * len(orphaned_ids))
-                    CURSOR.execute(f"""
-                        DELETE
-                        FROM tags
-                        WHERE tag_id
-                        IN ({tmp})
-                    """,tuple(orphaned_ids))
-                
+            if CURSOR.rowcount:
                 #attempt to commit changes
                 DB.commit()
                 print(f"Transaction ID {transactionID} has bee successfully deleted")
                 return True
             else:
-                #if no transaction with passed id found, return false
+                #if no transaction with passed id found, release the write
+                #transaction the DELETE opened and return false
+                DB.rollback()
                 print(f"No transaction with ID {transactionID} found")
                 return False
         except sqlite3.Error as e:
@@ -523,14 +624,16 @@ def db_delete_tag (tags: list[str] = None) -> bool:
     #checks for empty list of passed tags
     if tags is not None:
         try:
-            #loop through list of tags and attempt to delete them from tag table
-            #in SQL db
-            for tag in tags:
-                CURSOR.execute("""
+            #delete the listed tags from tag table in SQL db, one IN (...)
+            #list per chunk of names; cascade clears their joint table entries
+            for chunk in _db_chunks(tuple(tags)):
+                tmp = ','.join('?' * len(chunk))
+                CURSOR.execute(f"""
                     DELETE
                     FROM tags
-                    WHERE name = ?
-                    """, (tag,))
+                    WHERE name
+                    IN ({tmp})
+                    """, chunk)
             
             #since transactions can exist without tags, unlike tags that can NOT
             #exist without a transaction, no additional pruning is required
@@ -557,23 +660,88 @@ def db_fetch_tags () -> list[tuple[int,str]]:
     Returns:
         list[tuple[int,str]]: list of tuples representing tags and their ids
     """    
-    #build empty object to append tags to
-    fetch = []
-    
-    #executes SQL query and loops through each object in list it returns
-    for row in CURSOR.execute("""
+    #executes SQL query; fetchall builds the list in C rather than
+    #appending row by row
+    CURSOR.execute("""
             SELECT ROWID, name
             FROM tags
             ORDER BY ROWID
-        """):
-        #appends result from each row of query's return
-        fetch.append(row)
-    return fetch
+        """)
+    return CURSOR.fetchall()
+
+def db_fetch_totals () -> tuple[float,float]:
+    """Sums credit (income) and debit (expense) ammounts across all
+    transactions inside SQLite without returning any rows
+
+    Returns:
+        tuple[float,float]: (income, expense) totals, both positive
+    """
+    CURSOR.execute("""
+        SELECT
+            COALESCE(SUM(CASE WHEN amnt < 0 THEN -amnt END), 0.0) AS income,
+            COALESCE(SUM(CASE WHEN amnt >= 0 THEN amnt END), 0.0) AS expense
+        FROM transactions
+        """)
+    return CURSOR.fetchone()
+
+def db_fetch_category_totals () -> list[tuple[str,float]]:
+    """Sums debit (expense) ammounts per category tag inside SQLite so reports
+    do not have to loop over every transaction in Python
+
+    Returns:
+        list[tuple[str,float]]: list of (category, total) tuples sorted by
+            total descending; transactions without a "category:" tag are
+            grouped under an empty string
+    """
+    #correlated subquery picks a single category tag per transaction so a
+    #transaction with several tags is only summed once
+    CURSOR.execute("""
+        SELECT
+            COALESCE((
+                SELECT SUBSTR(Tag.name, 10)
+                FROM transactions_tags AS JT
+                JOIN tags AS Tag ON JT.tag_id = Tag.ROWID
+                WHERE JT.transaction_id = T.ROWID
+                AND SUBSTR(Tag.name, 1, 9) = 'category:'
+                LIMIT 1
+            ), '') AS category,
+            SUM(T.amnt) AS total
+        FROM transactions AS T
+        WHERE T.amnt >= 0
+        GROUP BY category
+        ORDER BY total DESC
+        """)
+    return CURSOR.fetchall()
+
+def db_fetch_monthly_totals () -> list[tuple[str,float,float]]:
+    """Sums credit (income) and debit (expense) ammounts per month inside
+    SQLite. Rows whose date is not a real, zero-padded YYYY-MM-DD calendar
+    date (e.g. 2024-13-99, 2024-02-30 or 2024-1-5) are skipped
+
+    Returns:
+        list[tuple[str,float,float]]: list of (YYYY-MM, income, expense)
+            tuples sorted by month, both totals positive
+    """
+    #ISO dates sort lexicographically, so the first 7 chars are the month key;
+    #date(..., '+0 days') returns NULL for an impossible month and rolls an
+    #impossible day over, so only real calendar dates compare equal to
+    #themselves
+    CURSOR.execute("""
+        SELECT
+            SUBSTR(date, 1, 7) AS month,
+            SUM(CASE WHEN amnt < 0 THEN -amnt ELSE 0.0 END) AS income,
+            SUM(CASE WHEN amnt >= 0 THEN amnt ELSE 0.0 END) AS expense
+        FROM transactions
+        WHERE date GLOB '[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]'
+        AND date(date, '+0 days') = date
+        GROUP BY month
+        ORDER BY month
+        """)
+    return CURSOR.fetchall()
 
-#TODO
-#not commented as these functions are still in development    
 def db_bulk_add_transaction (transaction_list:list[str,str,float,list[str]] = None) -> bool:
-    """bulk adds transactions from a list of transactions
+    """bulk adds transactions from a list of transactions inside a single
+    database transaction, so the whole batch costs one commit
 
     Args:
         transaction_list (list[str,str,float,list[str]], optional): 
@@ -583,11 +751,38 @@ def db_bulk_add_transaction (transaction_list:list[str,str,float,list[str]] = No
         bool: returns true on successful add of ALL transactions;
             false on atleast one failed add, empty transaction list, or db error
     """
-    #TODO
-    pass
+    #checks for empty transaction list
+    if transaction_list:
+        try:
+            #insert every transaction before committing once at the end
+            for date, desc, amnt, tags in transaction_list:
+                _db_insert_transaction(date, desc, amnt, tags)
+            DB.commit()
+        except sqlite3.Error as e:
+            #gracefully catches any error, rolls back the WHOLE batch, prints
+            #error to console, and informs function caller of failed add via
+            #false return value
+            print("Error bulk adding transactions: ",e)
+            DB.rollback()
+            return False
+        
+        #a large import can skew the index statistics the planner uses for
+        #the joins and filters, so refresh them once the batch is committed
+        if len(transaction_list) >= _ANALYZE_BATCH_SIZE:
+            try:
+                CURSOR.execute("ANALYZE;")
+                DB.commit()
+            except sqlite3.Error as e:
+                print("Error analyzing database: ",e)
+        return True
+    else:
+        #returns false if passed transaction list is empty
+        print("Transaction list is empty")
+        return False
 
 def db_bulk_remove_transaction(transaction_list: list[int] = None) -> bool:
-    """removes several transactions based on transaction list
+    """removes several transactions based on transaction list inside a single
+    database transaction, pruning orphaned tags once for the whole batch
 
     Args:
         transaction_list (list[int], optional): list of transaction IDs.
@@ -595,11 +790,52 @@ def db_bulk_remove_transaction(transaction_list: list[int] = None) -> bool:
 
     Returns:
         bool: returns True on successful removal of ALL transactions;
-            false if atleast one removal fails, empty id list, or db error
+            false (with nothing removed) if atleast one id is not found,
+            empty id list, or db error
     """
-    #TODO
-    pass
+    #checks for empty id list
+    if transaction_list:
+        #duplicate ids only need to be deleted once
+        ids = tuple(set(transaction_list))
+        try:
+            #delete the transactions one IN (...) list per chunk of ids, all
+            #in the same transaction; cascade clears the joint table entries
+            #and trg_prune_orphan_tag prunes their tags
+            deleted = 0
+            for chunk in _db_chunks(ids):
+                tmp = ','.join('?' * len(chunk))
+                CURSOR.execute(f"""
+                    DELETE
+                    FROM transactions
+                    WHERE ROWID
+                    IN ({tmp})
+                """, chunk)
+                deleted += CURSOR.rowcount
+            if deleted != len(ids):
+                #atleast one id had no transaction; undo the whole batch
+                DB.rollback()
+                print(f"Only {deleted} of {len(ids)} transactions found, "
+                      "nothing deleted")
+                return False
+            
+            #attempt to commit changes
+            DB.commit()
+            print(f"{deleted} transactions successfully deleted")
+            return True
+        except sqlite3.Error as e:
+            #gracefully catches any error, rolls back the WHOLE batch, prints
+            #error to console, and informs function caller of failed removal
+            #via false return value
+            print("Error bulk deleting transactions: ",e)
+            DB.rollback()
+            return False
+    else:
+        #returns false if passed id list is empty
+        print("Transaction list is empty")
+        return False
 
+#TODO
+#not commented as these functions are still in development
 def db_bulk_add_tag (transaction_list: list[int] = None, tags: list[str] = None) -> bool:
     """adds a list of tags to ALL transactions in transaction list
 
@@ -644,9 +880,11 @@ def _db_debug():
     """private, helper function to test db functionality for internal debugging
     purposes. not intented to be called outside of db_handler
     """
-    #clears previous db    
-    if os.path.exists("debug.db"):
-        os.remove("debug.db")
+    #clears previous db (db_init opens it under data/), along with any WAL
+    #files left beside it
+    for path in ("data/debug.db", "data/debug.db-wal", "data/debug.db-shm"):
+        if os.path.exists(path):
+            os.remove(path)
     
     #inits db
     db_init("debug.db")
@@ -663,17 +901,19 @@ def _db_debug():
     _db_debug_print(db_fetch_all())
     print()
     
-    #adding more transactions for testing
-    db_add_transaction("2000-01-20", "Burger King", 15.50, ["Fast Food", "Lunch"])
-    db_add_transaction("2000-02-05", "Exxon Gas Station", 45.00, ["Gas", "Commute"])
-    db_add_transaction("2000-04-10", "Amazon", 8.99, [])
-    db_add_transaction("2000-05-15", "Movie Theater", 32.75, ["Entertainment", "Date Night"])
-    db_add_transaction("2000-06-25", "Whole Foods", 75.00, ["Groceries"])
-    db_add_transaction("2000-07-30", "Netflix", 16.99, ["Subscription", "Entertainment"])
-    db_add_transaction("2001-01-01", "ZeroTag1", 100.00, [])
-    db_add_transaction("2001-01-01", "ZeroTag2", 100.00, [])
-    db_add_transaction("2001-01-01", "ZeroTag3", 100.00, [])
-    db_add_transaction("2001-01-01", "ZeroTag4", 100.00, [])
+    #adding more transactions for testing, seeded in one db transaction
+    db_bulk_add_transaction([
+        ("2000-01-20", "Burger King", 15.50, ["Fast Food", "Lunch"]),
+        ("2000-02-05", "Exxon Gas Station", 45.00, ["Gas", "Commute"]),
+        ("2000-04-10", "Amazon", 8.99, []),
+        ("2000-05-15", "Movie Theater", 32.75, ["Entertainment", "Date Night"]),
+        ("2000-06-25", "Whole Foods", 75.00, ["Groceries"]),
+        ("2000-07-30", "Netflix", 16.99, ["Subscription", "Entertainment"]),
+        ("2001-01-01", "ZeroTag1", 100.00, []),
+        ("2001-01-01", "ZeroTag2", 100.00, []),
+        ("2001-01-01", "ZeroTag3", 100.00, []),
+        ("2001-01-01", "ZeroTag4", 100.00, []),
+    ])
     _db_debug_print(db_fetch_all_tagless())
     print()
     
@@ -748,4 +988,6 @@ else:
     #informs console of proper use and initializes database for use
     print("Loading database handler module...")
     db_init()
+    #one connection is shared for the whole process; close it on exit
+    atexit.register(db_close)
     print("Database handler initialized")
\ No newline at end of file